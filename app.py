@@ -3,6 +3,13 @@ from datetime import datetime, date
 from fpdf import FPDF
 import os
 from pathlib import Path
+from certificate_models import (
+    GENDERS, FITNESS_PURPOSES, LICENSE_TYPES, VISION_VALUES,
+    AGE_RANGE, RTO_AGE_RANGE, HEIGHT_RANGE, WEIGHT_RANGE,
+    MedicalCertificateInput, FitnessCertificateInput,
+    SickLeaveCertificateInput, Form1AInput,
+)
+from certificate_index import DEFAULT_REPRINT_WINDOW_DAYS, INDEX_RETENTION_DAYS, render_or_reuse
 
 # Page config - MUST BE FIRST!
 st.set_page_config(
@@ -55,7 +62,8 @@ st.markdown('<div class="main-header"><h1>🏥 Medical Certificate Generator</h1
 def generate_medical_certificate(clinic_name, clinic_address, clinic_phone, clinic_email, clinic_reg,
                                  doctor_name, doctor_qualification, doctor_reg_no, doctor_specialty,
                                  patient_name, patient_age, patient_gender, patient_designation,
-                                 patient_office, exam_date, medical_condition, leave_from, leave_to, notes):
+                                 patient_office, exam_date, medical_condition, leave_from, leave_to, notes,
+                                 file_tag=""):
     
     pdf = FPDF()
     pdf.add_page()
@@ -122,14 +130,15 @@ def generate_medical_certificate(clinic_name, clinic_address, clinic_phone, clin
     pdf.set_font("Arial", "I", 8)
     pdf.cell(0, 5, "This is a computer-generated certificate and requires doctor's signature and official seal to be valid.", 0, 1, "C")
     
-    filename = f"certificates/Medical_Certificate_{patient_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    filename = f"certificates/Medical_Certificate_{patient_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{'_' + file_tag if file_tag else ''}.pdf"
     pdf.output(filename)
     return filename
 
 def generate_fitness_certificate(clinic_name, clinic_address, clinic_phone, clinic_email, clinic_reg,
                                  doctor_name, doctor_qualification, doctor_reg_no, doctor_specialty,
                                  applicant_name, applicant_age, applicant_gender, applicant_designation,
-                                 applicant_office, exam_date, fitness_purpose, previous_illness, remarks):
+                                 applicant_office, exam_date, fitness_purpose, previous_illness, remarks,
+                                 file_tag=""):
     
     pdf = FPDF()
     pdf.add_page()
@@ -203,14 +212,15 @@ def generate_fitness_certificate(clinic_name, clinic_address, clinic_phone, clin
     pdf.set_font("Arial", "I", 8)
     pdf.cell(0, 5, "This is a computer-generated certificate and requires doctor's signature and official seal to be valid.", 0, 1, "C")
     
-    filename = f"certificates/Fitness_Certificate_{applicant_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    filename = f"certificates/Fitness_Certificate_{applicant_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{'_' + file_tag if file_tag else ''}.pdf"
     pdf.output(filename)
     return filename
 
 def generate_sick_leave_certificate(clinic_name, clinic_address, clinic_phone, clinic_email, clinic_reg,
                                     doctor_name, doctor_qualification, doctor_reg_no, doctor_specialty,
                                     employee_name, employee_id, employee_dept, employee_company,
-                                    exam_date, illness, leave_from, leave_to, rest_advised, follow_up):
+                                    exam_date, illness, leave_from, leave_to, rest_advised, follow_up,
+                                    file_tag=""):
     
     pdf = FPDF()
     pdf.add_page()
@@ -298,7 +308,7 @@ def generate_sick_leave_certificate(clinic_name, clinic_address, clinic_phone, c
     pdf.set_font("Arial", "I", 8)
     pdf.cell(0, 5, "This is a computer-generated certificate and requires doctor's signature and official seal to be valid.", 0, 1, "C")
     
-    filename = f"certificates/Sick_Leave_Certificate_{employee_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    filename = f"certificates/Sick_Leave_Certificate_{employee_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{'_' + file_tag if file_tag else ''}.pdf"
     pdf.output(filename)
     return filename
 
@@ -306,7 +316,8 @@ def generate_form_1a(clinic_name, clinic_address, clinic_phone, clinic_email, cl
                     doctor_name, doctor_qualification, doctor_reg_no, doctor_specialty,
                     applicant_name, applicant_age, applicant_gender, applicant_address,
                     license_type, exam_date, height, weight, vision_right, vision_left,
-                    color_blind, hearing_normal, physical_deformity, fit_to_drive):
+                    color_blind, hearing_normal, physical_deformity, fit_to_drive,
+                    file_tag=""):
     
     pdf = FPDF()
     pdf.add_page()
@@ -414,7 +425,7 @@ def generate_form_1a(clinic_name, clinic_address, clinic_phone, clinic_email, cl
     pdf.cell(0, 5, "This certificate is valid only with doctor's signature and official stamp/seal.", 0, 1, "C")
     pdf.cell(0, 5, "Note: This certificate should be submitted to the RTO along with other required documents.", 0, 1, "C")
     
-    filename = f"certificates/Form_1A_{applicant_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    filename = f"certificates/Form_1A_{applicant_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{'_' + file_tag if file_tag else ''}.pdf"
     pdf.output(filename)
     return filename
 
@@ -434,6 +445,21 @@ with st.sidebar:
     doctor_reg_no = st.text_input("Medical Registration No.*", value="MCI12345", key="doc_reg")
     doctor_specialty = st.text_input("Specialization", value="General Physician", key="doc_spec")
 
+    st.divider()
+    st.header("♻️ Reprints")
+    reprint_window_days = st.number_input("Reuse identical certificates issued within (days)",
+                                          min_value=0, max_value=INDEX_RETENTION_DAYS, value=DEFAULT_REPRINT_WINDOW_DAYS,
+                                          help="Set to 0 to always generate a new PDF", key="reprint_window")
+
+clinic = {"name": clinic_name, "address": clinic_address, "phone": clinic_phone,
+          "email": clinic_email, "registration": clinic_reg}
+
+def show_result(result, label):
+    if result.reprint:
+        st.info(f"♻️ Identical {label} already issued on {result.issued_at.strftime('%d/%m/%Y %H:%M')} - returning the existing PDF (reprint).")
+    else:
+        st.success(f"✅ {label} Generated Successfully!")
+
 # Main content
 tab1, tab2, tab3, tab4 = st.tabs(["📋 Medical Certificate", "💪 Fitness Certificate", "🏃 Sick Leave Certificate", "📄 Form 1A (RTO)"])
 
@@ -446,8 +472,8 @@ with tab1:
     with col1:
         st.subheader("Patient Information")
         patient_name_mc = st.text_input("Patient Name*", key="patient_mc")
-        patient_age_mc = st.number_input("Age", min_value=0, max_value=120, value=25, key="age_mc")
-        patient_gender_mc = st.selectbox("Gender", ["Male", "Female", "Other"], key="gender_mc")
+        patient_age_mc = st.number_input("Age", min_value=AGE_RANGE[0], max_value=AGE_RANGE[1], value=25, key="age_mc")
+        patient_gender_mc = st.selectbox("Gender", list(GENDERS), key="gender_mc")
         patient_designation_mc = st.text_input("Designation/Occupation", key="desig_mc")
         patient_office_mc = st.text_input("Office/Organization", key="office_mc")
         
@@ -472,26 +498,34 @@ with tab1:
                                           key="notes_mc")
     
     if st.button("Generate Medical Certificate", key="gen_mc"):
-        if not all([patient_name_mc, medical_condition, doctor_name, doctor_qualification]):
-            st.error("Please fill all required fields marked with *")
-        elif leave_from_mc > leave_to_mc:
-            st.error("Please correct the leave dates!")
+        cert = MedicalCertificateInput(
+            doctor_name=doctor_name, doctor_qualification=doctor_qualification,
+            doctor_reg_no=doctor_reg_no, doctor_specialty=doctor_specialty,
+            patient_name=patient_name_mc, patient_age=patient_age_mc,
+            patient_gender=patient_gender_mc, patient_designation=patient_designation_mc,
+            patient_office=patient_office_mc, exam_date=examination_date_mc,
+            medical_condition=medical_condition, leave_from=leave_from_mc,
+            leave_to=leave_to_mc, notes=additional_notes_mc
+        )
+        errors = cert.validate()
+        if errors:
+            st.error("Please correct the following:\n\n" + "\n".join(f"- {e}" for e in errors))
         else:
             try:
-                pdf = generate_medical_certificate(
+                result = render_or_reuse(clinic, cert, lambda tag: generate_medical_certificate(
                     clinic_name, clinic_address, clinic_phone, clinic_email, clinic_reg,
-                    doctor_name, doctor_qualification, doctor_reg_no, doctor_specialty,
-                    patient_name_mc, patient_age_mc, patient_gender_mc, patient_designation_mc,
-                    patient_office_mc, examination_date_mc, medical_condition, 
-                    leave_from_mc, leave_to_mc, additional_notes_mc
-                )
-                st.success("✅ Medical Certificate Generated Successfully!")
+                    cert.doctor_name, cert.doctor_qualification, cert.doctor_reg_no, cert.doctor_specialty,
+                    cert.patient_name, cert.patient_age, cert.patient_gender, cert.patient_designation,
+                    cert.patient_office, cert.exam_date, cert.medical_condition,
+                    cert.leave_from, cert.leave_to, cert.notes, file_tag=tag
+                ), reprint_window_days)
+                show_result(result, "Medical Certificate")
                 
-                with open(pdf, "rb") as file:
+                with open(result.filename, "rb") as file:
                     st.download_button(
                         label="📥 Download Medical Certificate",
                         data=file,
-                        file_name=f"Medical_Certificate_{patient_name_mc.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                        file_name=f"Medical_Certificate_{patient_name_mc.replace(' ', '_')}_{result.issued_at.strftime('%Y%m%d')}.pdf",
                         mime="application/pdf"
                     )
             except Exception as e:
@@ -506,8 +540,8 @@ with tab2:
     with col1:
         st.subheader("Applicant Information")
         applicant_name_fc = st.text_input("Applicant Name*", key="applicant_fc")
-        applicant_age_fc = st.number_input("Age", min_value=0, max_value=120, value=25, key="age_fc")
-        applicant_gender_fc = st.selectbox("Gender", ["Male", "Female", "Other"], key="gender_fc")
+        applicant_age_fc = st.number_input("Age", min_value=AGE_RANGE[0], max_value=AGE_RANGE[1], value=25, key="age_fc")
+        applicant_gender_fc = st.selectbox("Gender", list(GENDERS), key="gender_fc")
         applicant_designation_fc = st.text_input("Designation/Position Applied", key="desig_fc")
         applicant_office_fc = st.text_input("Office/Organization", key="office_fc")
         
@@ -515,8 +549,7 @@ with tab2:
         st.subheader("Fitness Details")
         examination_date_fc = st.date_input("Date of Examination", value=date.today(), key="exam_date_fc")
         fitness_purpose = st.selectbox("Purpose of Fitness Certificate", 
-                                      ["Government Service", "Private Job", "Promotion", 
-                                       "Transfer", "Sports/Athletics", "Other"], 
+                                      list(FITNESS_PURPOSES), 
                                       key="purpose_fc")
         previous_illness = st.text_area("Previous Medical History (if any)", 
                                        placeholder="E.g., Recovered from fever", 
@@ -526,24 +559,34 @@ with tab2:
                                       key="remarks_fc")
     
     if st.button("Generate Fitness Certificate", key="gen_fc"):
-        if not all([applicant_name_fc, doctor_name, doctor_qualification]):
-            st.error("Please fill all required fields marked with *")
+        cert = FitnessCertificateInput(
+            doctor_name=doctor_name, doctor_qualification=doctor_qualification,
+            doctor_reg_no=doctor_reg_no, doctor_specialty=doctor_specialty,
+            applicant_name=applicant_name_fc, applicant_age=applicant_age_fc,
+            applicant_gender=applicant_gender_fc, applicant_designation=applicant_designation_fc,
+            applicant_office=applicant_office_fc, exam_date=examination_date_fc,
+            fitness_purpose=fitness_purpose, previous_illness=previous_illness,
+            remarks=fitness_remarks
+        )
+        errors = cert.validate()
+        if errors:
+            st.error("Please correct the following:\n\n" + "\n".join(f"- {e}" for e in errors))
         else:
             try:
-                pdf = generate_fitness_certificate(
+                result = render_or_reuse(clinic, cert, lambda tag: generate_fitness_certificate(
                     clinic_name, clinic_address, clinic_phone, clinic_email, clinic_reg,
-                    doctor_name, doctor_qualification, doctor_reg_no, doctor_specialty,
-                    applicant_name_fc, applicant_age_fc, applicant_gender_fc, 
-                    applicant_designation_fc, applicant_office_fc, examination_date_fc,
-                    fitness_purpose, previous_illness, fitness_remarks
-                )
-                st.success("✅ Fitness Certificate Generated Successfully!")
+                    cert.doctor_name, cert.doctor_qualification, cert.doctor_reg_no, cert.doctor_specialty,
+                    cert.applicant_name, cert.applicant_age, cert.applicant_gender,
+                    cert.applicant_designation, cert.applicant_office, cert.exam_date,
+                    cert.fitness_purpose, cert.previous_illness, cert.remarks, file_tag=tag
+                ), reprint_window_days)
+                show_result(result, "Fitness Certificate")
                 
-                with open(pdf, "rb") as file:
+                with open(result.filename, "rb") as file:
                     st.download_button(
                         label="📥 Download Fitness Certificate",
                         data=file,
-                        file_name=f"Fitness_Certificate_{applicant_name_fc.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                        file_name=f"Fitness_Certificate_{applicant_name_fc.replace(' ', '_')}_{result.issued_at.strftime('%Y%m%d')}.pdf",
                         mime="application/pdf"
                     )
             except Exception as e:
@@ -582,26 +625,34 @@ with tab3:
         follow_up = st.date_input("Follow-up Date (if applicable)", key="followup_sl")
     
     if st.button("Generate Sick Leave Certificate", key="gen_sl"):
-        if not all([employee_name_sl, employee_company, illness_sl, doctor_name, doctor_qualification]):
-            st.error("Please fill all required fields marked with *")
-        elif leave_from_sl > leave_to_sl:
-            st.error("Please correct the leave dates!")
+        cert = SickLeaveCertificateInput(
+            doctor_name=doctor_name, doctor_qualification=doctor_qualification,
+            doctor_reg_no=doctor_reg_no, doctor_specialty=doctor_specialty,
+            employee_name=employee_name_sl, employee_id=employee_id,
+            employee_dept=employee_dept, employee_company=employee_company,
+            exam_date=examination_date_sl, illness=illness_sl,
+            leave_from=leave_from_sl, leave_to=leave_to_sl,
+            rest_advised=rest_advised, follow_up=follow_up
+        )
+        errors = cert.validate()
+        if errors:
+            st.error("Please correct the following:\n\n" + "\n".join(f"- {e}" for e in errors))
         else:
             try:
-                pdf = generate_sick_leave_certificate(
+                result = render_or_reuse(clinic, cert, lambda tag: generate_sick_leave_certificate(
                     clinic_name, clinic_address, clinic_phone, clinic_email, clinic_reg,
-                    doctor_name, doctor_qualification, doctor_reg_no, doctor_specialty,
-                    employee_name_sl, employee_id, employee_dept, employee_company,
-                    examination_date_sl, illness_sl, leave_from_sl, leave_to_sl,
-                    rest_advised, follow_up.strftime('%d/%m/%Y') if follow_up else None
-                )
-                st.success("✅ Sick Leave Certificate Generated Successfully!")
+                    cert.doctor_name, cert.doctor_qualification, cert.doctor_reg_no, cert.doctor_specialty,
+                    cert.employee_name, cert.employee_id, cert.employee_dept, cert.employee_company,
+                    cert.exam_date, cert.illness, cert.leave_from, cert.leave_to,
+                    cert.rest_advised, cert.follow_up.strftime('%d/%m/%Y') if cert.follow_up else None, file_tag=tag
+                ), reprint_window_days)
+                show_result(result, "Sick Leave Certificate")
                 
-                with open(pdf, "rb") as file:
+                with open(result.filename, "rb") as file:
                     st.download_button(
                         label="📥 Download Sick Leave Certificate",
                         data=file,
-                        file_name=f"Sick_Leave_Certificate_{employee_name_sl.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                        file_name=f"Sick_Leave_Certificate_{employee_name_sl.replace(' ', '_')}_{result.issued_at.strftime('%Y%m%d')}.pdf",
                         mime="application/pdf"
                     )
             except Exception as e:
@@ -616,12 +667,11 @@ with tab4:
     with col1:
         st.subheader("Applicant Information")
         applicant_name_rto = st.text_input("Applicant Name*", key="applicant_rto")
-        applicant_age_rto = st.number_input("Age", min_value=16, max_value=120, value=25, key="age_rto")
-        applicant_gender_rto = st.selectbox("Gender", ["Male", "Female", "Other"], key="gender_rto")
+        applicant_age_rto = st.number_input("Age", min_value=RTO_AGE_RANGE[0], max_value=RTO_AGE_RANGE[1], value=25, key="age_rto")
+        applicant_gender_rto = st.selectbox("Gender", list(GENDERS), key="gender_rto")
         applicant_address_rto = st.text_area("Address*", key="address_rto")
         license_type = st.selectbox("License Type*", 
-                                   ["Two Wheeler", "Four Wheeler (LMV)", "Transport Vehicle", 
-                                    "Commercial Vehicle", "Renewal"], 
+                                   list(LICENSE_TYPES), 
                                    key="license_type")
         
     with col2:
@@ -629,12 +679,12 @@ with tab4:
         examination_date_rto = st.date_input("Date of Examination", value=date.today(), key="exam_date_rto")
         
         st.write("**Physical Fitness**")
-        height = st.number_input("Height (cm)", min_value=100, max_value=250, value=170, key="height_rto")
-        weight = st.number_input("Weight (kg)", min_value=30, max_value=200, value=70, key="weight_rto")
+        height = st.number_input("Height (cm)", min_value=HEIGHT_RANGE[0], max_value=HEIGHT_RANGE[1], value=170, key="height_rto")
+        weight = st.number_input("Weight (kg)", min_value=WEIGHT_RANGE[0], max_value=WEIGHT_RANGE[1], value=70, key="weight_rto")
         
         st.write("**Vision Test**")
-        vision_right = st.selectbox("Right Eye", ["6/6", "6/9", "6/12", "6/18", "6/24", "6/36", "6/60"], key="vision_r")
-        vision_left = st.selectbox("Left Eye", ["6/6", "6/9", "6/12", "6/18", "6/24", "6/36", "6/60"], key="vision_l")
+        vision_right = st.selectbox("Right Eye", list(VISION_VALUES), key="vision_r")
+        vision_left = st.selectbox("Left Eye", list(VISION_VALUES), key="vision_l")
         color_blind = st.checkbox("Color Blindness Detected", key="color_blind")
         
         st.write("**Other Checks**")
@@ -643,25 +693,36 @@ with tab4:
         fit_to_drive = st.checkbox("Fit to Drive", value=True, key="fit_drive")
     
     if st.button("Generate Form 1A", key="gen_rto"):
-        if not all([applicant_name_rto, applicant_address_rto, license_type, doctor_name, doctor_qualification]):
-            st.error("Please fill all required fields marked with *")
+        cert = Form1AInput(
+            doctor_name=doctor_name, doctor_qualification=doctor_qualification,
+            doctor_reg_no=doctor_reg_no, doctor_specialty=doctor_specialty,
+            applicant_name=applicant_name_rto, applicant_age=applicant_age_rto,
+            applicant_gender=applicant_gender_rto, applicant_address=applicant_address_rto,
+            license_type=license_type, exam_date=examination_date_rto,
+            height=height, weight=weight, vision_right=vision_right, vision_left=vision_left,
+            color_blind=color_blind, hearing_normal=hearing_normal,
+            physical_deformity=physical_deformity, fit_to_drive=fit_to_drive
+        )
+        errors = cert.validate()
+        if errors:
+            st.error("Please correct the following:\n\n" + "\n".join(f"- {e}" for e in errors))
         else:
             try:
-                pdf = generate_form_1a(
+                result = render_or_reuse(clinic, cert, lambda tag: generate_form_1a(
                     clinic_name, clinic_address, clinic_phone, clinic_email, clinic_reg,
-                    doctor_name, doctor_qualification, doctor_reg_no, doctor_specialty,
-                    applicant_name_rto, applicant_age_rto, applicant_gender_rto,
-                    applicant_address_rto, license_type, examination_date_rto,
-                    height, weight, vision_right, vision_left, color_blind,
-                    hearing_normal, physical_deformity, fit_to_drive
-                )
-                st.success("✅ Form 1A Generated Successfully!")
+                    cert.doctor_name, cert.doctor_qualification, cert.doctor_reg_no, cert.doctor_specialty,
+                    cert.applicant_name, cert.applicant_age, cert.applicant_gender,
+                    cert.applicant_address, cert.license_type, cert.exam_date,
+                    cert.height, cert.weight, cert.vision_right, cert.vision_left, cert.color_blind,
+                    cert.hearing_normal, cert.physical_deformity, cert.fit_to_drive, file_tag=tag
+                ), reprint_window_days)
+                show_result(result, "Form 1A")
                 
-                with open(pdf, "rb") as file:
+                with open(result.filename, "rb") as file:
                     st.download_button(
                         label="📥 Download Form 1A",
                         data=file,
-                        file_name=f"Form_1A_{applicant_name_rto.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                        file_name=f"Form_1A_{applicant_name_rto.replace(' ', '_')}_{result.issued_at.strftime('%Y%m%d')}.pdf",
                         mime="application/pdf"
                     )
             except Exception as e:
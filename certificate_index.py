@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import threading
+from collections import namedtuple
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+INDEX_PATH = Path("certificates/index.jsonl")
+DEFAULT_REPRINT_WINDOW_DAYS = 30
+# Entries are kept this long regardless of any session's reprint window
+INDEX_RETENTION_DAYS = 365
+# How often a process rewrites the index to drop stale entries
+COMPACT_INTERVAL = timedelta(hours=24)
+# Length of the content-key prefix added to rendered filenames
+FILE_TAG_LENGTH = 12
+
+RenderResult = namedtuple("RenderResult", ["filename", "reprint", "issued_at"])
+
+_lock = threading.Lock()
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def certificate_key(clinic, cert):
+    """Content hash of a certificate request.
+
+    ``clinic`` is a mapping of the clinic details printed on the header and
+    ``cert`` a certificate input model. Whitespace differences are ignored
+    and the issue timestamp is not part of the key.
+    """
+    payload = {
+        "type": type(cert).__name__,
+        "clinic": {k: _normalize(v) for k, v in clinic.items()},
+        "fields": {k: _normalize(v) for k, v in asdict(cert).items()},
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _parse_line(line):
+    """Return (key, filename, issued_at) for an index line, or None if malformed."""
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(entry, dict):
+        return None
+    key, filename = entry.get("key"), entry.get("filename")
+    if not isinstance(key, str) or not isinstance(filename, str):
+        return None
+    try:
+        issued_at = datetime.fromisoformat(entry["issued_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return key, filename, issued_at
+
+
+def _format_line(key, filename, issued_at):
+    entry = {"key": key, "filename": filename, "issued_at": issued_at.isoformat()}
+    return (json.dumps(entry, sort_keys=True) + "\n").encode("utf-8")
+
+
+class _Index:
+    """In-memory view of an append-only JSON-lines index file.
+
+    Each render appends one line, and lookups only read the lines appended
+    since the last refresh. Dropping stale entries means rewriting the file
+    and checking every PDF, so compact() runs at most once per
+    COMPACT_INTERVAL in each process.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries = {}
+        self.offset = 0
+        self.inode = None
+        self.compacted_at = None
+
+    def refresh(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self.entries, self.offset, self.inode = {}, 0, None
+            return
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            self.entries, self.offset, self.inode = {}, 0, stat.st_ino
+        if stat.st_size == self.offset:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            entry = _parse_line(line)
+            if entry:
+                self.entries[entry[0]] = entry[1:]
+        self.offset += end
+
+    def append(self, key, filename, issued_at):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+b") as f:
+            # Start on a fresh line if a previous write was cut short
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(_format_line(key, filename, issued_at))
+        self.refresh()
+
+    def compact(self, now):
+        self.refresh()
+        retention = timedelta(days=INDEX_RETENTION_DAYS)
+        live = {key: (filename, issued_at) for key, (filename, issued_at) in self.entries.items()
+                if now - issued_at <= retention and os.path.exists(filename)}
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            for key, (filename, issued_at) in live.items():
+                f.write(_format_line(key, filename, issued_at))
+        os.replace(tmp, self.path)
+        self.compacted_at = now
+        self.refresh()
+
+
+_indexes = {}
+
+
+def _get_index(path):
+    path = Path(path)
+    if path not in _indexes:
+        _indexes[path] = _Index(path)
+    return _indexes[path]
+
+
+def render_or_reuse(clinic, cert, render, window_days=DEFAULT_REPRINT_WINDOW_DAYS, path=INDEX_PATH):
+    """Return the PDF for ``cert``, rendering it only if needed.
+
+    If an identical request was issued within ``window_days`` and its PDF
+    still exists, that file is returned as a reprint. Otherwise
+    ``render(file_tag)`` is called with a short prefix of the content key to
+    include in the filename, and the result is recorded. A window of 0 always
+    renders.
+
+    Entries are kept for INDEX_RETENTION_DAYS whatever the caller's window,
+    and entries whose PDF no longer exists are dropped on compaction.
+    """
+    key = certificate_key(clinic, cert)
+    now = datetime.now().replace(microsecond=0)
+    with _lock:
+        index = _get_index(path)
+        index.refresh()
+        entry = index.entries.get(key)
+    if entry and window_days > 0:
+        filename, issued_at = entry
+        if now - issued_at <= timedelta(days=window_days) and os.path.exists(filename):
+            return RenderResult(filename, True, issued_at)
+
+    filename = render(key[:FILE_TAG_LENGTH])
+    with _lock:
+        index.append(key, filename, now)
+        if index.compacted_at is None or now - index.compacted_at >= COMPACT_INTERVAL:
+            index.compact(now)
+    return RenderResult(filename, False, now)
@@ -0,0 +1,332 @@
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from typing import Optional, get_type_hints
+
+# Choices shared with the UI selectboxes
+GENDERS = ("Male", "Female", "Other")
+FITNESS_PURPOSES = ("Government Service", "Private Job", "Promotion",
+                    "Transfer", "Sports/Athletics", "Other")
+LICENSE_TYPES = ("Two Wheeler", "Four Wheeler (LMV)", "Transport Vehicle",
+                 "Commercial Vehicle", "Renewal")
+VISION_VALUES = ("6/6", "6/9", "6/12", "6/18", "6/24", "6/36", "6/60")
+
+# Numeric ranges shared with the UI number inputs
+AGE_RANGE = (0, 120)
+RTO_AGE_RANGE = (16, 120)
+HEIGHT_RANGE = (100, 250)
+WEIGHT_RANGE = (30, 200)
+
+_TRUE_STRINGS = {"1", "true", "yes", "y"}
+_FALSE_STRINGS = {"0", "false", "no", "n"}
+
+
+def _label(name):
+    return name.replace("_", " ").capitalize()
+
+
+def _to_date(value):
+    if value is None or isinstance(value, date):
+        return value.date() if isinstance(value, datetime) else value
+    value = str(value).strip()
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%d", "%d/%m/%Y"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            pass
+    raise ValueError("must be a date (YYYY-MM-DD or DD/MM/YYYY)")
+
+
+def _to_int(value):
+    if isinstance(value, bool):
+        raise ValueError("must be a whole number")
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("must be a whole number")
+    if not number.is_integer():
+        raise ValueError("must be a whole number")
+    return int(number)
+
+
+def _to_bool(value):
+    if value is None or isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if not text:
+        return None
+    if text in _TRUE_STRINGS:
+        return True
+    if text in _FALSE_STRINGS:
+        return False
+    raise ValueError("must be yes or no")
+
+
+def _to_str(value):
+    return "" if value is None else str(value)
+
+
+_CONVERTERS = {
+    str: _to_str,
+    bool: _to_bool,
+    Optional[int]: _to_int,
+    Optional[date]: _to_date,
+}
+_converter_cache = {}
+
+
+def _converters(cls):
+    """Map each field of ``cls`` to its converter, resolving string annotations.
+
+    Fields of any other type are passed through unchanged.
+    """
+    if cls not in _converter_cache:
+        hints = get_type_hints(cls)
+        _converter_cache[cls] = [(f, _CONVERTERS.get(hints[f.name], lambda value: value))
+                                 for f in fields(cls)]
+    return _converter_cache[cls]
+
+
+@dataclass
+class CertificateInput:
+    """Base class for certificate inputs.
+
+    Subclasses declare their fields and the rules that apply to them:
+    ``_required`` field names, ``_ranges`` of (min, max), ``_choices`` of
+    allowed values and ``_date_order`` pairs that must not be reversed.
+    """
+
+    doctor_name: str = ""
+    doctor_qualification: str = ""
+    doctor_reg_no: str = ""
+    doctor_specialty: str = ""
+
+    _required = ("doctor_name", "doctor_qualification")
+    _ranges = {}
+    _choices = {}
+    _date_order = ()
+
+    @classmethod
+    def _convert(cls, data):
+        values = {}
+        errors = []
+        failed = set()
+        for f, convert in _converters(cls):
+            if f.name not in data:
+                continue
+            try:
+                value = convert(data[f.name])
+            except ValueError as e:
+                errors.append(f"{_label(f.name)} {e}")
+                failed.add(f.name)
+                continue
+            # A blank yes/no cell means "not provided": keep the field default
+            if value is not None or f.default is None:
+                values[f.name] = value
+        return values, errors, failed
+
+    @classmethod
+    def parse(cls, data):
+        """Build an input from a mapping (e.g. an imported CSV row).
+
+        Values are coerced to the field types; unknown keys are ignored and
+        fields that are blank or fail to convert keep their defaults. Returns
+        the input and a list of conversion and rule errors, one message per
+        problem.
+        """
+        values, errors, failed = cls._convert(data)
+        record = cls(**values)
+        return record, errors + record.validate(skip=failed)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Like parse(), but raise ValueError if any value fails to convert."""
+        values, errors, _ = cls._convert(data)
+        if errors:
+            raise ValueError("; ".join(errors))
+        return cls(**values)
+
+    def validate(self, skip=()):
+        """Return a list of error messages, empty if the input is valid.
+
+        Fields named in ``skip`` are not checked.
+        """
+        errors = []
+        for name in self._required:
+            if name in skip:
+                continue
+            value = getattr(self, name)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                errors.append(f"{_label(name)} is required")
+        for name, (low, high) in self._ranges.items():
+            if name in skip:
+                continue
+            value = getattr(self, name)
+            if value is not None and not low <= value <= high:
+                errors.append(f"{_label(name)} must be between {low} and {high}")
+        for name, allowed in self._choices.items():
+            if name in skip:
+                continue
+            value = getattr(self, name)
+            if value and value not in allowed:
+                errors.append(f"{_label(name)} must be one of: {', '.join(allowed)}")
+        for start, end in self._date_order:
+            if start in skip or end in skip:
+                continue
+            start_value, end_value = getattr(self, start), getattr(self, end)
+            if start_value and end_value and start_value > end_value:
+                errors.append(f"{_label(start)} cannot be after {_label(end).lower()}")
+        return errors
+
+    @property
+    def is_valid(self):
+        return not self.validate()
+
+
+@dataclass
+class MedicalCertificateInput(CertificateInput):
+    patient_name: str = ""
+    patient_age: Optional[int] = None
+    patient_gender: str = "Male"
+    patient_designation: str = ""
+    patient_office: str = ""
+    exam_date: Optional[date] = None
+    medical_condition: str = ""
+    leave_from: Optional[date] = None
+    leave_to: Optional[date] = None
+    notes: str = ""
+
+    _required = CertificateInput._required + (
+        "patient_name", "patient_age", "exam_date", "medical_condition", "leave_from", "leave_to")
+    _ranges = {"patient_age": AGE_RANGE}
+    _choices = {"patient_gender": GENDERS}
+    _date_order = (("leave_from", "leave_to"),)
+
+
+@dataclass
+class FitnessCertificateInput(CertificateInput):
+    applicant_name: str = ""
+    applicant_age: Optional[int] = None
+    applicant_gender: str = "Male"
+    applicant_designation: str = ""
+    applicant_office: str = ""
+    exam_date: Optional[date] = None
+    fitness_purpose: str = "Government Service"
+    previous_illness: str = ""
+    remarks: str = ""
+
+    _required = CertificateInput._required + ("applicant_name", "applicant_age", "exam_date")
+    _ranges = {"applicant_age": AGE_RANGE}
+    _choices = {"applicant_gender": GENDERS, "fitness_purpose": FITNESS_PURPOSES}
+
+
+@dataclass
+class SickLeaveCertificateInput(CertificateInput):
+    employee_name: str = ""
+    employee_id: str = ""
+    employee_dept: str = ""
+    employee_company: str = ""
+    exam_date: Optional[date] = None
+    illness: str = ""
+    leave_from: Optional[date] = None
+    leave_to: Optional[date] = None
+    rest_advised: bool = True
+    follow_up: Optional[date] = None
+
+    _required = CertificateInput._required + (
+        "employee_name", "employee_company", "exam_date", "illness", "leave_from", "leave_to")
+    _date_order = (("leave_from", "leave_to"),)
+
+
+@dataclass
+class Form1AInput(CertificateInput):
+    applicant_name: str = ""
+    applicant_age: Optional[int] = None
+    applicant_gender: str = "Male"
+    applicant_address: str = ""
+    license_type: str = ""
+    exam_date: Optional[date] = None
+    height: Optional[int] = None
+    weight: Optional[int] = None
+    vision_right: str = ""
+    vision_left: str = ""
+    color_blind: bool = False
+    hearing_normal: bool = True
+    physical_deformity: str = ""
+    fit_to_drive: bool = True
+
+    _required = CertificateInput._required + (
+        "applicant_name", "applicant_age", "applicant_address", "license_type", "exam_date",
+        "height", "weight", "vision_right", "vision_left")
+    _ranges = {"applicant_age": RTO_AGE_RANGE, "height": HEIGHT_RANGE, "weight": WEIGHT_RANGE}
+    _choices = {"applicant_gender": GENDERS, "license_type": LICENSE_TYPES,
+                "vision_right": VISION_VALUES, "vision_left": VISION_VALUES}
+
+
+class ValidationReport:
+    """Aggregated result of validating a batch of rows."""
+
+    def __init__(self):
+        self.valid = []
+        self.errors = {}
+        self.error_counts = Counter()
+        self.total = 0
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def add(self, index, record, errors):
+        self.total += 1
+        if errors:
+            self.errors[index] = errors
+            self.error_counts.update(errors)
+        else:
+            self.valid.append((index, record))
+
+    def summary(self):
+        lines = [f"{len(self.valid)} of {self.total} row(s) valid, {len(self.errors)} with errors"]
+        for message, count in self.error_counts.most_common():
+            lines.append(f"  {count} x {message}")
+        return "\n".join(lines)
+
+
+def validate_records(model, rows, defaults=None):
+    """Validate an iterable of mappings against ``model`` in a single pass.
+
+    ``defaults`` (e.g. the doctor details) are applied to every row before
+    the row's own values. Unknown columns and extra cells without a column
+    (``csv.DictReader`` stores them under ``None``) are reported as errors
+    for that row. Returns a ValidationReport.
+    """
+    report = ValidationReport()
+    known = {f.name for f in fields(model)}
+    for index, row in enumerate(rows):
+        if not isinstance(row, Mapping):
+            report.add(index, None, ["Row is not a mapping of column names to values"])
+            continue
+        column_errors = []
+        for key in row:
+            if not isinstance(key, str):
+                column_errors.append("Row has extra cells without a column name")
+            elif key not in known:
+                column_errors.append(f"Unknown column '{key}'")
+        try:
+            record, errors = model.parse({**defaults, **row} if defaults else row)
+        except Exception as e:
+            record, errors = None, [f"Row could not be read ({type(e).__name__})"]
+        report.add(index, record, column_errors + errors)
+    return report
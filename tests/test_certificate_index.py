@@ -0,0 +1,140 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+import certificate_index
+from certificate_index import FILE_TAG_LENGTH, certificate_key, render_or_reuse
+from certificate_models import FitnessCertificateInput
+
+CLINIC = {"name": "Clinic", "address": "1 Main Road"}
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return tmp_path / "certificates" / "index.jsonl"
+
+
+@pytest.fixture
+def render(tmp_path):
+    rendered = []
+
+    def render(tag):
+        path = tmp_path / f"cert_{len(rendered)}_{tag}.pdf"
+        path.write_text("pdf")
+        rendered.append(str(path))
+        return str(path)
+
+    render.rendered = rendered
+    return render
+
+
+@pytest.fixture
+def compact_every_render(monkeypatch):
+    monkeypatch.setattr(certificate_index, "COMPACT_INTERVAL", timedelta(0))
+
+
+def cert(name="Ann Lee"):
+    return FitnessCertificateInput("Dr. A", "MBBS", applicant_name=name, applicant_age=30)
+
+
+def read_index(index_path):
+    return [json.loads(line) for line in index_path.read_text().splitlines()]
+
+
+def backdate(index_path, days, name=None):
+    key = certificate_key(CLINIC, cert(name)) if name else None
+    lines = []
+    for entry in read_index(index_path):
+        if key is None or entry["key"] == key:
+            entry["issued_at"] = (datetime.now() - timedelta(days=days)).replace(microsecond=0).isoformat()
+        lines.append(json.dumps(entry) + "\n")
+    tmp = index_path.with_suffix(".edit")
+    tmp.write_text("".join(lines))
+    os.replace(tmp, index_path)
+
+
+def test_key_ignores_whitespace():
+    assert certificate_key(CLINIC, cert("Ann  Lee ")) == certificate_key(CLINIC, cert("Ann Lee"))
+    assert certificate_key(CLINIC, cert("Ann Lee")) != certificate_key(CLINIC, cert("Ann Leigh"))
+    assert certificate_key(dict(CLINIC, name="Other"), cert()) != certificate_key(CLINIC, cert())
+
+
+def test_identical_request_is_a_reprint(index_path, render):
+    first = render_or_reuse(CLINIC, cert(), render, path=index_path)
+    second = render_or_reuse(CLINIC, cert("Ann  Lee"), render, path=index_path)
+    assert not first.reprint
+    assert second.reprint
+    assert second.filename == first.filename
+    assert second.issued_at == first.issued_at
+    assert len(render.rendered) == 1
+
+
+def test_render_gets_content_key_tag(index_path, render):
+    render_or_reuse(CLINIC, cert("Ann"), render, path=index_path)
+    render_or_reuse(CLINIC, cert("Bob"), render, path=index_path)
+    tags = [path.rsplit("_", 1)[1][:-len(".pdf")] for path in render.rendered]
+    assert tags == [certificate_key(CLINIC, cert(name))[:FILE_TAG_LENGTH] for name in ("Ann", "Bob")]
+
+
+@pytest.mark.parametrize("age_days, reprint", [(29.99, True), (30.01, False)])
+def test_window_boundary(index_path, render, age_days, reprint):
+    render_or_reuse(CLINIC, cert(), render, window_days=30, path=index_path)
+    backdate(index_path, age_days)
+    result = render_or_reuse(CLINIC, cert(), render, window_days=30, path=index_path)
+    assert result.reprint is reprint
+
+
+def test_zero_window_always_renders(index_path, render):
+    render_or_reuse(CLINIC, cert(), render, window_days=0, path=index_path)
+    result = render_or_reuse(CLINIC, cert(), render, window_days=0, path=index_path)
+    assert not result.reprint
+    assert len(render.rendered) == 2
+
+
+def test_missing_pdf_is_rendered_again(index_path, render):
+    first = render_or_reuse(CLINIC, cert(), render, path=index_path)
+    os.remove(first.filename)
+    result = render_or_reuse(CLINIC, cert(), render, path=index_path)
+    assert not result.reprint
+    assert result.filename != first.filename
+
+
+@pytest.mark.parametrize("content", [
+    "not json\n", "[]\n", '{"key": 1}\n', '{"key": "k", "filename": "x.pdf"}\n',
+    '{"key": "k", "filename": "x.pdf", "issued_at": "yesterday"}\n', '{"truncated": ',
+])
+def test_corrupt_index_is_a_cache_miss(index_path, render, content):
+    index_path.parent.mkdir(parents=True)
+    index_path.write_text(content)
+    result = render_or_reuse(CLINIC, cert(), render, path=index_path)
+    assert not result.reprint
+    assert [entry["key"] for entry in read_index(index_path)] == [certificate_key(CLINIC, cert())]
+    assert render_or_reuse(CLINIC, cert(), render, path=index_path).reprint
+
+
+def test_short_window_does_not_evict_entries(index_path, render, compact_every_render):
+    render_or_reuse(CLINIC, cert("Ann"), render, path=index_path)
+    backdate(index_path, 10)
+    render_or_reuse(CLINIC, cert("Bob"), render, window_days=1, path=index_path)
+    assert render_or_reuse(CLINIC, cert("Ann"), render, path=index_path).reprint
+
+
+def test_stale_and_missing_entries_are_pruned(index_path, render, compact_every_render):
+    old = render_or_reuse(CLINIC, cert("Old"), render, path=index_path)
+    backdate(index_path, certificate_index.INDEX_RETENTION_DAYS + 1, name="Old")
+    gone = render_or_reuse(CLINIC, cert("Gone"), render, path=index_path)
+    os.remove(gone.filename)
+    render_or_reuse(CLINIC, cert("New"), render, window_days=0, path=index_path)
+
+    index = read_index(index_path)
+    assert [entry["key"] for entry in index] == [certificate_key(CLINIC, cert("New"))]
+    assert old.filename not in [entry["filename"] for entry in index]
+
+
+def test_compaction_is_rate_limited(index_path, render):
+    render_or_reuse(CLINIC, cert("Ann"), render, path=index_path)
+    os.remove(render.rendered[0])
+    render_or_reuse(CLINIC, cert("Bob"), render, path=index_path)
+    assert len(read_index(index_path)) == 2
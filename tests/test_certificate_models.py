@@ -0,0 +1,157 @@
+import csv
+import io
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional  # noqa: F401 - used by a string annotation below
+
+import pytest
+
+from certificate_models import (
+    CertificateInput,
+    Form1AInput,
+    MedicalCertificateInput,
+    SickLeaveCertificateInput,
+    validate_records,
+)
+
+DOCTOR = {"doctor_name": "Dr. A", "doctor_qualification": "MBBS"}
+
+
+def form_1a_row(**overrides):
+    row = {
+        "applicant_name": "Ann Lee",
+        "applicant_age": "30",
+        "applicant_address": "1 Main Road",
+        "license_type": "Renewal",
+        "exam_date": "2024-01-02",
+        "height": "170",
+        "weight": 70,
+        "vision_right": "6/6",
+        "vision_left": "6/9",
+    }
+    row.update(overrides)
+    return row
+
+
+def test_valid_rows():
+    report = validate_records(Form1AInput, [form_1a_row(), form_1a_row(color_blind="no")], defaults=DOCTOR)
+    assert report.ok
+    assert report.total == 2
+    index, record = report.valid[0]
+    assert index == 0
+    assert record.applicant_age == 30
+    assert record.exam_date == date(2024, 1, 2)
+    assert report.valid[1][1].color_blind is False
+
+
+def test_defaults_are_overridden_by_row():
+    report = validate_records(Form1AInput, [form_1a_row(doctor_name="Dr. B")], defaults=DOCTOR)
+    assert report.valid[0][1].doctor_name == "Dr. B"
+    assert report.valid[0][1].doctor_qualification == "MBBS"
+
+
+def test_missing_defaults_reports_required_fields():
+    report = validate_records(Form1AInput, [form_1a_row()])
+    assert report.errors == {0: ["Doctor name is required", "Doctor qualification is required"]}
+
+
+@pytest.mark.parametrize("value", ["abc", "inf", "1e400", "25.9", True, 30.5])
+def test_non_integer_age_is_a_type_error(value):
+    report = validate_records(Form1AInput, [form_1a_row(applicant_age=value)], defaults=DOCTOR)
+    assert report.errors == {0: ["Applicant age must be a whole number"]}
+
+
+def test_integral_float_is_accepted():
+    record = Form1AInput.from_dict(dict(DOCTOR, **form_1a_row(height="170.0")))
+    assert record.height == 170
+
+
+def test_type_and_rule_errors_are_reported_together_and_grouped():
+    rows = [
+        form_1a_row(applicant_age="abc", color_blind="maybe", vision_left="6/7"),
+        form_1a_row(applicant_age="x", applicant_name=""),
+    ]
+    report = validate_records(Form1AInput, rows, defaults=DOCTOR)
+    assert report.errors[0] == [
+        "Applicant age must be a whole number",
+        "Color blind must be yes or no",
+        "Vision left must be one of: 6/6, 6/9, 6/12, 6/18, 6/24, 6/36, 6/60",
+    ]
+    assert report.errors[1] == ["Applicant age must be a whole number", "Applicant name is required"]
+    assert report.error_counts["Applicant age must be a whole number"] == 2
+    assert not report.valid
+
+
+def test_range_and_choice_errors():
+    report = validate_records(
+        Form1AInput,
+        [form_1a_row(applicant_age=15, height=99, license_type="Tractor")],
+        defaults=DOCTOR,
+    )
+    assert report.errors[0] == [
+        "Applicant age must be between 16 and 120",
+        "Height must be between 100 and 250",
+        "License type must be one of: Two Wheeler, Four Wheeler (LMV), Transport Vehicle, "
+        "Commercial Vehicle, Renewal",
+    ]
+
+
+def test_leave_date_order():
+    cert = MedicalCertificateInput(
+        "Dr. A", "MBBS", patient_name="P", patient_age=40, exam_date=date(2024, 1, 1),
+        medical_condition="Fever", leave_from=date(2024, 1, 5), leave_to=date(2024, 1, 3),
+    )
+    assert cert.validate() == ["Leave from cannot be after leave to"]
+
+    report = validate_records(SickLeaveCertificateInput, [{
+        "employee_name": "E", "employee_company": "Co", "exam_date": "01/01/2024",
+        "illness": "Flu", "leave_from": "2024-01-05", "leave_to": "2024-01-05",
+    }], defaults=DOCTOR)
+    assert report.ok
+
+
+def test_from_dict_raises_on_conversion_errors():
+    with pytest.raises(ValueError, match="Applicant age must be a whole number"):
+        Form1AInput.from_dict({"applicant_age": "inf"})
+
+
+def test_summary_counts_messages():
+    report = validate_records(Form1AInput, [form_1a_row(), form_1a_row(weight="heavy")], defaults=DOCTOR)
+    assert report.summary() == "1 of 2 row(s) valid, 1 with errors\n  1 x Weight must be a whole number"
+
+
+def test_ragged_csv_row_is_reported_not_raised():
+    reader = csv.DictReader(io.StringIO("applicant_name,applicant_age\nAnn,30,extra\nBob,40\n"))
+    report = validate_records(Form1AInput, reader, defaults=DOCTOR)
+    assert report.total == 2
+    assert report.errors[0][0] == "Row has extra cells without a column name"
+    assert "Row has extra cells without a column name" not in report.errors[1]
+
+
+def test_unknown_column_and_non_mapping_rows():
+    report = validate_records(Form1AInput, [form_1a_row(nickname="A"), ["not", "a", "row"]], defaults=DOCTOR)
+    assert report.errors[0] == ["Unknown column 'nickname'"]
+    assert report.errors[1] == ["Row is not a mapping of column names to values"]
+
+
+@pytest.mark.parametrize("blank", ["", "  ", None])
+def test_blank_yes_no_cell_keeps_default(blank):
+    record, errors = Form1AInput.parse(dict(DOCTOR, **form_1a_row(
+        fit_to_drive=blank, hearing_normal=blank, color_blind=blank)))
+    assert errors == []
+    assert record.fit_to_drive is True
+    assert record.hearing_normal is True
+    assert record.color_blind is False
+
+
+@dataclass
+class _ExtraInput(CertificateInput):
+    tags: list = None
+    visits: "Optional[int]" = None
+
+
+def test_unmapped_and_string_annotations():
+    record, errors = _ExtraInput.parse(dict(DOCTOR, tags=["a"], visits="3"))
+    assert errors == []
+    assert record.tags == ["a"]
+    assert record.visits == 3